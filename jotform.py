@@ -9,7 +9,10 @@
 # package : JotFormAPI
 
 from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import requests
+import itertools
 import json
 import logging
 import pathlib
@@ -59,8 +62,13 @@ class JotformAPIClient(object):
             'apiKey': self.api_key
         }
 
+        # JSON payloads go in the request body, everything else in the query.
+        data = None
+        if isinstance(params, str):
+            data, params = params, None
+
         resp = requests.request(method=method, url=url,
-            headers=headers, params=params)
+            headers=headers, params=params, data=data)
 
         json_response = resp.json()
         return json_response.get('content')
@@ -95,6 +103,69 @@ class JotformAPIClient(object):
 
         return params
 
+    @staticmethod
+    def create_history_windows(start_date, end_date, tz, window='day'):
+        """Split a date range into consecutive day or week windows.
+
+        Dates are MM/DD/YYYY strings or Arrow objects in the time zone tz,
+        and end_date is inclusive. Each window is a half-open
+        (start_date, end_date) tuple of MM/DD/YYYY strings, where end_date is
+        the first day after the window; the first and last windows are
+        clipped to the requested range.
+        """
+        if window not in ('day', 'week'):
+            raise ValueError("window must be 'day' or 'week', not %r" % (window,))
+
+        if isinstance(start_date, arrow.Arrow):
+            start_date = start_date.to(tz)
+        else:
+            start_date = arrow.get(start_date, 'MM/DD/YYYY', tzinfo=tz)
+        if isinstance(end_date, arrow.Arrow):
+            end_date = end_date.to(tz)
+        else:
+            end_date = arrow.get(end_date, 'MM/DD/YYYY', tzinfo=tz)
+
+        start_date = start_date.floor('day')
+        end_date = end_date.floor('day').shift(days=1)
+        windows = []
+
+        for floor, ceil in arrow.Arrow.span_range(window, start_date, end_date.shift(days=-1)):
+            low = max(floor, start_date)
+            high = min(floor.shift(**{window + 's': 1}), end_date)
+            windows.append((low.format('MM/DD/YYYY'), high.format('MM/DD/YYYY')))
+
+        return windows
+
+    @staticmethod
+    def diff_properties(current, desired):
+        """Keys of desired whose values differ from current.
+
+        The API returns property values as strings, so scalars are compared
+        by their string form; lists and dicts are compared as-is. Desired
+        values should use the API's string forms, e.g. 'Yes'/'No' rather than
+        True/False, or they will differ on every call. Keys whose desired
+        value is None are skipped, since None cannot be sent.
+        """
+        current = current or {}
+        changed = {}
+
+        for key, value in desired.items():
+            if value is None:
+                continue
+
+            if key not in current:
+                changed[key] = value
+                continue
+
+            old = current[key]
+            if isinstance(value, (dict, list)) or isinstance(old, (dict, list)):
+                if old != value:
+                    changed[key] = value
+            elif str(old) != str(value):
+                changed[key] = value
+
+        return changed
+
     def get_user(self):
         """Get user account details for a JotForm user.
 
@@ -214,6 +285,84 @@ class JotformAPIClient(object):
 
         return self.fetch_url('/user/history', params, 'GET')
 
+    def iter_history(self, start_date, end_date, window='day', action=None,
+                     sort_by=None, max_workers=4, done_windows=None, tz=None):
+        """Iterate over the user activity log one date window at a time.
+
+        Windows are fetched concurrently, at most max_workers at a time, and
+        yielded in order so entries come out sorted by timestamp without
+        holding the whole range in memory. Entries outside their window's
+        half-open [startDate, endDate) range are dropped, so windows never
+        overlap whether or not the API treats endDate as inclusive.
+
+        Args:
+            start_date (string): Start of the range. Format: MM/DD/YYYY.
+            end_date (string): End of the range, inclusive. Format: MM/DD/YYYY.
+            window (string): Size of each request window, 'day' or 'week'. Default is 'day'.
+            action (enum): Filter results by activity performed. Default is 'all'.
+            sort_by (enum): Lists results by ascending and descending order. Default is ascending.
+            max_workers (int): Number of windows fetched concurrently. Default is 4.
+            done_windows (set): Windows to skip. Each window is added as soon as its last entry has been yielded, so a cancelled run can be resumed by passing the same set again. (optional)
+            tz (string): Time zone the account reads dates in, used for window boundaries. Taken from the account settings when omitted. (optional)
+
+        Returns:
+            Activity log entries, one at a time.
+
+        Raises:
+            ValueError: If the time zone is not given and the account settings have none, or an entry has no valid timestamp.
+        """
+
+        if tz is None:
+            tz = (self.get_settings() or {}).get('time_zone')
+            if not tz:
+                raise ValueError('Account settings have no time_zone; pass tz explicitly')
+
+        reverse = str(sort_by).upper() == 'DESC'
+        windows = self.create_history_windows(start_date, end_date, tz, window)
+        if reverse:
+            windows.reverse()
+        if done_windows is not None:
+            windows = [w for w in windows if w not in done_windows]
+
+        def fetch(window):
+            low, high = (arrow.get(d, 'MM/DD/YYYY', tzinfo=tz).int_timestamp
+                         for d in window)
+            params = self.create_history_query(action, None, sort_by, *window)
+            entries = self.fetch_url('/user/history', params, 'GET') or []
+            entries = [e for e in entries
+                       if low <= self._history_timestamp(e) < high]
+            return sorted(entries, key=self._history_timestamp, reverse=reverse)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        windows = iter(windows)
+
+        try:
+            for w in itertools.islice(windows, max_workers):
+                pending.append((w, executor.submit(fetch, w)))
+
+            while pending:
+                w, future = pending.popleft()
+                entries = future.result()
+
+                for next_window in itertools.islice(windows, 1):
+                    pending.append((next_window, executor.submit(fetch, next_window)))
+
+                for entry in entries:
+                    yield entry
+
+                if done_windows is not None:
+                    done_windows.add(w)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _history_timestamp(entry):
+        try:
+            return int(entry['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('History entry has no valid timestamp: %r' % (entry,))
+
     def get_form(self, id):
         """Get basic information about a form.
 
@@ -582,6 +731,65 @@ class JotformAPIClient(object):
 
         return self.fetch_url('/form/' + form_id + '/properties', form_properties, 'PUT')
 
+    def reconcile_form_properties(self, form_id, form_properties, current=None):
+        """Set only the properties of a form that differ from their current values.
+
+        Args:
+            form_id (string): Form ID is the numbers you see on a form URL. You can get form IDs when you call /user/forms.
+            form_properties (array): Desired properties like label width.
+            current (array): Current properties, e.g. from a cache. Fetched with /form/{id}/properties when omitted. (optional)
+
+        Returns:
+            Properties that were changed, empty if nothing changed. Plain values are sent in one POST, lists and dicts in one JSON PUT.
+        """
+
+        if current is None:
+            current = self.get_form_properties(form_id)
+
+        changed = self.diff_properties(current, form_properties)
+        nested = {k: v for k, v in changed.items() if isinstance(v, (dict, list))}
+        flat = {k: v for k, v in changed.items() if k not in nested}
+
+        if flat:
+            self.set_form_properties(form_id, flat)
+        if nested:
+            self.set_multiple_form_properties(
+                form_id, json.dumps({'properties': nested}))
+
+        return changed
+
+    def reconcile_form_questions(self, form_id, questions, current=None):
+        """Edit only the question properties of a form that differ from their current values.
+
+        Args:
+            form_id (string): Form ID is the numbers you see on a form URL. You can get form IDs when you call /user/forms.
+            questions (array): Desired question properties keyed by question ID.
+            current (array): Current questions keyed by question ID, e.g. from a cache. Fetched with /form/{id}/questions when omitted. (optional)
+
+        Returns:
+            Changed properties keyed by question ID. One request is sent per changed question.
+        """
+
+        if current is None:
+            current = self.get_form_questions(form_id)
+
+        current = current or {}
+        changes = {}
+
+        for qid, question_properties in questions.items():
+            changed = self.diff_properties(current.get(qid), question_properties)
+            for key, value in changed.items():
+                if isinstance(value, (dict, list)):
+                    raise ValueError('Question %s property %s must be a plain value, not %s'
+                                     % (qid, key, type(value).__name__))
+            if changed:
+                changes[qid] = changed
+
+        for qid, changed in changes.items():
+            self.edit_form_question(form_id, qid, changed)
+
+        return changes
+
     def create_form(self, form):
         """ Create a new form
 
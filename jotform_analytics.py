@@ -0,0 +1,285 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# JotForm API - Python Client
+#
+# Column-oriented submission analytics. Requires NumPy:
+#
+#     $ pip install jotform[analytics]
+
+import numpy as np
+
+
+CATEGORICAL_TYPES = {'control_dropdown', 'control_radio'}
+MULTIPLE_CHOICE_TYPES = {'control_checkbox'}
+NUMERIC_TYPES = {'control_number', 'control_spinner', 'control_scale',
+                 'control_rating', 'control_slider'}
+NON_INPUT_TYPES = {'control_head', 'control_button', 'control_text',
+                   'control_pagebreak', 'control_divider', 'control_collapse',
+                   'control_image', 'control_captcha'}
+
+
+class _Buffer(object):
+    """Growable NumPy array, doubled in place as values are appended."""
+
+    def __init__(self, dtype):
+        self._data = np.empty(64, dtype=dtype)
+        self._size = 0
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        size = self._size + len(values)
+
+        if size > len(self._data):
+            data = np.empty(max(size, 2 * len(self._data)), dtype=self._data.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+        self._data[self._size:size] = values
+        self._size = size
+
+    @property
+    def values(self):
+        return self._data[:self._size]
+
+
+class _CategoricalColumn(object):
+    """Single choice answers, dictionary-encoded as int32 codes (-1 if unanswered)."""
+
+    def __init__(self):
+        self.categories = []
+        self._index = {}
+        self._codes = _Buffer(np.int32)
+
+    def _encode(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def extend(self, answers, offset):
+        self._codes.extend([-1 if a is None else self._encode(str(a)) for a in answers])
+
+    def answered(self, n):
+        return self._codes.values >= 0
+
+    def counts(self):
+        codes = self._codes.values
+        return np.bincount(codes[codes >= 0], minlength=len(self.categories))
+
+
+class _MultipleChoiceColumn(_CategoricalColumn):
+    """Multiple choice answers, stored as flat codes with their submission row."""
+
+    def __init__(self):
+        super(_MultipleChoiceColumn, self).__init__()
+        self._rows = _Buffer(np.int64)
+
+    def extend(self, answers, offset):
+        codes = []
+        rows = []
+
+        for row, answer in enumerate(answers, offset):
+            if answer is None:
+                continue
+            if isinstance(answer, str):
+                answer = [answer]
+            for value in answer:
+                codes.append(self._encode(str(value)))
+                rows.append(row)
+
+        self._codes.extend(codes)
+        self._rows.extend(rows)
+
+    def answered(self, n):
+        mask = np.zeros(n, dtype=bool)
+        mask[self._rows.values] = True
+        return mask
+
+
+class _NumericColumn(object):
+    """Numeric answers as float64 (NaN if unanswered or not a number)."""
+
+    def __init__(self):
+        self._values = _Buffer(np.float64)
+        self._answered = _Buffer(bool)
+
+    @staticmethod
+    def _parse(answer):
+        try:
+            return float(answer)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def extend(self, answers, offset):
+        self._values.extend([self._parse(a) for a in answers])
+        self._answered.extend([a is not None for a in answers])
+
+    def answered(self, n):
+        return self._answered.values
+
+    @property
+    def values(self):
+        return self._values.values
+
+
+class _AnswerColumn(object):
+    """Free-form answers; only whether the question was answered is kept."""
+
+    def __init__(self):
+        self._answered = _Buffer(bool)
+
+    def extend(self, answers, offset):
+        self._answered.extend([a is not None for a in answers])
+
+    def answered(self, n):
+        return self._answered.values
+
+
+class SubmissionAnalytics(object):
+    """Per-question answer columns built incrementally from form submissions.
+
+    Example:
+        questions = client.get_form_questions(form_id)
+        analytics = SubmissionAnalytics(questions)
+
+        for offset in range(0, total, 1000):
+            analytics.update(client.get_form_submissions(form_id, offset, 1000))
+
+        analytics.counts('3')
+    """
+
+    def __init__(self, questions):
+        """
+        Args:
+            questions (array): Question properties keyed by question ID, as returned by /form/{id}/questions.
+        """
+        self.columns = {}
+
+        for qid, question in questions.items():
+            qtype = question.get('type')
+            if qtype in NON_INPUT_TYPES:
+                continue
+            elif qtype in MULTIPLE_CHOICE_TYPES:
+                self.columns[qid] = _MultipleChoiceColumn()
+            elif qtype in CATEGORICAL_TYPES:
+                self.columns[qid] = _CategoricalColumn()
+            elif qtype in NUMERIC_TYPES:
+                self.columns[qid] = _NumericColumn()
+            else:
+                self.columns[qid] = _AnswerColumn()
+
+        self._created_at = _Buffer('datetime64[s]')
+        self.size = 0
+
+    @staticmethod
+    def _answer(answers, qid):
+        answer = (answers.get(qid) or {}).get('answer')
+
+        if isinstance(answer, dict):
+            if not any(answer.values()):
+                return None
+        elif not answer and answer != 0:
+            return None
+
+        return answer
+
+    def update(self, submissions):
+        """Append a page of submissions.
+
+        The page is validated before anything is stored, so a page that
+        raises leaves the existing columns unchanged.
+
+        Args:
+            submissions (array): Submissions as returned by /form/{id}/submissions.
+
+        Raises:
+            ValueError: If a submission has a missing or invalid created_at.
+        """
+        submissions = submissions or []
+
+        try:
+            created_at = np.array([s['created_at'] for s in submissions],
+                                  dtype='datetime64[s]')
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('Every submission needs a valid created_at')
+
+        answers = [s.get('answers') or {} for s in submissions]
+        columns = {qid: [self._answer(a, qid) for a in answers]
+                   for qid in self.columns}
+
+        for qid, column in self.columns.items():
+            column.extend(columns[qid], self.size)
+
+        self._created_at.extend(created_at)
+        self.size += len(submissions)
+
+    def _column(self, qid, column_type, question_types):
+        column = self.columns[qid]
+        if not isinstance(column, column_type):
+            raise ValueError('Question %s is not one of the supported question types: %s'
+                             % (qid, ', '.join(sorted(question_types))))
+        return column
+
+    def counts(self, qid):
+        """Number of times each choice was picked for a dropdown, radio or checkbox question.
+
+        Returns:
+            Choice counts keyed by choice text.
+        """
+        column = self._column(qid, _CategoricalColumn,
+                              CATEGORICAL_TYPES | MULTIPLE_CHOICE_TYPES)
+        return dict(zip(column.categories, column.counts().tolist()))
+
+    def completion_rate(self, qid):
+        """Fraction of submissions in which the question was answered.
+
+        Any non-empty answer counts, including numeric answers that are not
+        valid numbers.
+        """
+        if not self.size:
+            return 0.0
+        return float(np.count_nonzero(self.columns[qid].answered(self.size))) / self.size
+
+    def completion_rates(self):
+        """Completion rate of every question, keyed by question ID."""
+        return {qid: self.completion_rate(qid) for qid in self.columns}
+
+    def histogram(self, qid, bins=10):
+        """Histogram of the answers to a numeric question.
+
+        Answers that are not valid numbers are left out.
+
+        Returns:
+            Counts and bin edges, as from numpy.histogram.
+        """
+        values = self._column(qid, _NumericColumn, NUMERIC_TYPES).values
+        return np.histogram(values[~np.isnan(values)], bins=bins)
+
+    def describe(self, qid):
+        """Count, mean, min and max of the valid answers to a numeric question."""
+        values = self._column(qid, _NumericColumn, NUMERIC_TYPES).values
+        values = values[~np.isnan(values)]
+
+        if not len(values):
+            return {'count': 0, 'mean': None, 'min': None, 'max': None}
+
+        return {
+            'count': len(values),
+            'mean': float(values.mean()),
+            'min': float(values.min()),
+            'max': float(values.max())
+        }
+
+    def created_at_counts(self, unit='D'):
+        """Number of submissions per time bucket of created_at.
+
+        Args:
+            unit (string): NumPy datetime unit to bucket by, e.g. 'h', 'D', 'W' or 'M'. Default is 'D'.
+
+        Returns:
+            Bucket start times and submission counts, as two arrays.
+        """
+        buckets = self._created_at.values.astype('datetime64[' + unit + ']')
+        return np.unique(buckets, return_counts=True)
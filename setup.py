@@ -7,9 +7,12 @@ setup(
     description='JotForm API - Python Client',
     author='JotForm',
     author_email='api@jotform.com',
-    py_modules=['jotform'],
+    py_modules=['jotform', 'jotform_analytics'],
     install_requires=[
         'requests',
         'lxml'
-    ]
+    ],
+    extras_require={
+        'analytics': ['numpy']
+    }
 )
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from jotform_analytics import SubmissionAnalytics
+
+
+QUESTIONS = {
+    '1': {'type': 'control_head', 'text': 'Survey'},
+    '2': {'type': 'control_radio', 'text': 'Color'},
+    '3': {'type': 'control_checkbox', 'text': 'Pets'},
+    '4': {'type': 'control_number', 'text': 'Age'},
+    '5': {'type': 'control_textbox', 'text': 'Name'},
+    '6': {'type': 'control_button', 'text': 'Submit'}
+}
+
+
+def submission(created_at, color=None, pets=None, age=None, name=None):
+    answers = {
+        '2': {'answer': color},
+        '3': {'answer': pets},
+        '4': {'answer': age},
+        '5': {'answer': name}
+    }
+    return {'created_at': created_at,
+            'answers': {k: v for k, v in answers.items() if v['answer'] is not None}}
+
+
+PAGES = [
+    [
+        submission('2024-01-01 09:00:00', 'Red', ['Cat', 'Dog'], '30', 'Ann'),
+        submission('2024-01-01 17:30:00', 'Blue', 'Cat', '40'),
+    ],
+    [
+        submission('2024-01-02 08:00:00', 'Red', None, 'abc', 'Bob'),
+        submission('2024-01-03 12:00:00', None, [], None, ''),
+    ]
+]
+
+
+@pytest.fixture
+def analytics():
+    analytics = SubmissionAnalytics(QUESTIONS)
+    for page in PAGES:
+        analytics.update(page)
+    return analytics
+
+
+def test_non_input_questions_are_skipped(analytics):
+    assert sorted(analytics.columns) == ['2', '3', '4', '5']
+
+
+def test_counts(analytics):
+    assert analytics.counts('2') == {'Red': 2, 'Blue': 1}
+    assert analytics.counts('3') == {'Cat': 2, 'Dog': 1}
+
+
+def test_completion_rates(analytics):
+    assert analytics.size == 4
+    assert analytics.completion_rates() == {
+        '2': 0.75,
+        '3': 0.5,
+        '4': 0.75,
+        '5': 0.5
+    }
+
+
+def test_histogram_and_describe_ignore_invalid_numbers(analytics):
+    counts, edges = analytics.histogram('4', bins=2)
+
+    assert counts.tolist() == [1, 1]
+    assert edges.tolist() == [30.0, 35.0, 40.0]
+    assert analytics.describe('4') == {'count': 2, 'mean': 35.0, 'min': 30.0, 'max': 40.0}
+
+
+def test_created_at_counts(analytics):
+    buckets, counts = analytics.created_at_counts('D')
+
+    assert buckets.tolist() == list(np.array(['2024-01-01', '2024-01-02', '2024-01-03'],
+                                             dtype='datetime64[D]').tolist())
+    assert counts.tolist() == [2, 1, 1]
+
+
+def test_update_grows_past_initial_buffer():
+    analytics = SubmissionAnalytics(QUESTIONS)
+    for _ in range(50):
+        analytics.update(PAGES[0])
+
+    assert analytics.size == 100
+    assert analytics.counts('3') == {'Cat': 100, 'Dog': 50}
+    assert analytics.describe('4')['count'] == 100
+
+
+def test_wrong_question_type_raises_value_error(analytics):
+    with pytest.raises(ValueError, match='Question 4 .*control_radio'):
+        analytics.counts('4')
+    with pytest.raises(ValueError, match='Question 2 .*control_number'):
+        analytics.histogram('2')
+    with pytest.raises(ValueError, match='Question 5'):
+        analytics.describe('5')
+
+
+@pytest.mark.parametrize('created_at', [None, 'yesterday'])
+def test_bad_page_leaves_analytics_unchanged(analytics, created_at):
+    bad = submission('2024-01-04 10:00:00', 'Red', 'Cat', '20', 'Cy')
+    if created_at is None:
+        del bad['created_at']
+    else:
+        bad['created_at'] = created_at
+
+    with pytest.raises(ValueError, match='created_at'):
+        analytics.update([submission('2024-01-04 09:00:00', 'Blue'), bad])
+
+    analytics.update([submission('2024-01-05 09:00:00', 'Red')])
+
+    assert analytics.size == 5
+    assert analytics.counts('2') == {'Red': 3, 'Blue': 1}
+    assert analytics.completion_rate('2') == 0.8
+    assert analytics.describe('4')['count'] == 2
+    assert analytics.created_at_counts('D')[1].tolist() == [2, 1, 1, 1]
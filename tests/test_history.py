@@ -0,0 +1,158 @@
+import threading
+import time
+
+import arrow
+import pytest
+
+from jotform import JotformAPIClient
+
+
+DAYS = 8
+
+
+def day_entries(day, tz='UTC'):
+    start = arrow.get(2024, 1, day, tzinfo=tz).int_timestamp
+    return [{'type': 'formUpdate', 'timestamp': str(start + offset)}
+            for offset in (79200, 100, 200)]
+
+
+class StubClient(JotformAPIClient):
+    """Serves three entries per day of January 2024, reading dates in the
+    account's time zone and treating endDate as inclusive."""
+
+    def __init__(self, time_zone='UTC', block=None):
+        super(StubClient, self).__init__('KEY')
+        self.time_zone = time_zone
+        self.block = block
+        self.calls = []
+
+    def fetch_url(self, url, params=None, method=None):
+        if url == '/user/settings':
+            return {'time_zone': self.time_zone} if self.time_zone else {}
+
+        self.calls.append(params)
+        start = arrow.get(params['startDate'], 'MM/DD/YYYY')
+        end = arrow.get(params['endDate'], 'MM/DD/YYYY')
+
+        if self.block is not None and start.day > 1:
+            self.block.wait(5)
+
+        entries = []
+        for day in range(start.day, end.day + 1):
+            if day <= DAYS:
+                entries.extend(day_entries(day, self.time_zone))
+        return entries
+
+
+def all_timestamps(tz='UTC'):
+    return sorted(int(e['timestamp']) for day in range(1, DAYS + 1)
+                  for e in day_entries(day, tz))
+
+
+def test_create_history_windows_days():
+    assert JotformAPIClient.create_history_windows('01/01/2024', '01/03/2024', 'UTC') == [
+        ('01/01/2024', '01/02/2024'),
+        ('01/02/2024', '01/03/2024'),
+        ('01/03/2024', '01/04/2024')
+    ]
+
+
+def test_create_history_windows_weeks_are_clipped():
+    windows = JotformAPIClient.create_history_windows('01/03/2024', '01/20/2024', 'UTC', 'week')
+
+    assert windows == [
+        ('01/03/2024', '01/08/2024'),
+        ('01/08/2024', '01/15/2024'),
+        ('01/15/2024', '01/21/2024')
+    ]
+
+
+def test_iter_history_is_sorted_without_boundary_duplicates():
+    client = StubClient()
+
+    entries = list(client.iter_history('01/01/2024', '01/08/2024', max_workers=3))
+
+    assert [int(e['timestamp']) for e in entries] == all_timestamps()
+    assert len(client.calls) == DAYS
+
+
+def test_iter_history_uses_account_time_zone():
+    client = StubClient('America/New_York')
+
+    entries = list(client.iter_history('01/01/2024', '01/03/2024'))
+
+    timestamps = [int(e['timestamp']) for e in entries]
+    late_entry = arrow.get(2024, 1, 1, 22, tzinfo='America/New_York').int_timestamp
+    assert late_entry in timestamps
+    assert timestamps == all_timestamps('America/New_York')[:9]
+
+
+def test_iter_history_requires_a_time_zone():
+    client = StubClient(time_zone=None)
+
+    with pytest.raises(ValueError, match='time_zone'):
+        list(client.iter_history('01/01/2024', '01/03/2024'))
+    assert client.calls == []
+
+
+@pytest.mark.parametrize('window', ['hour', 'days', 'month'])
+def test_create_history_windows_rejects_other_windows(window):
+    with pytest.raises(ValueError, match='window'):
+        JotformAPIClient.create_history_windows('01/01/2024', '01/02/2024', 'UTC', window)
+
+
+def test_iter_history_raises_on_missing_timestamp():
+    class Client(StubClient):
+        def fetch_url(self, url, params=None, method=None):
+            entries = super(Client, self).fetch_url(url, params, method)
+            if url == '/user/history':
+                entries.append({'type': 'formUpdate'})
+            return entries
+
+    with pytest.raises(ValueError, match='no valid timestamp'):
+        list(Client().iter_history('01/01/2024', '01/01/2024'))
+
+
+def test_iter_history_descending():
+    client = StubClient()
+
+    entries = list(client.iter_history('01/01/2024', '01/08/2024', window='week',
+                                       sort_by='DESC'))
+
+    assert [int(e['timestamp']) for e in entries] == all_timestamps()[::-1]
+
+
+def test_iter_history_resumes_per_window():
+    client = StubClient()
+    done_windows = set()
+    kept = []
+
+    history = client.iter_history('01/01/2024', '01/08/2024', max_workers=4,
+                                  done_windows=done_windows)
+    first_run = [next(history) for _ in range(5)]
+    history.close()
+
+    assert done_windows == {('01/01/2024', '01/02/2024')}
+
+    # A consumer commits entries once their window is done.
+    kept.extend(first_run[:3])
+    kept.extend(client.iter_history('01/01/2024', '01/08/2024', max_workers=4,
+                                    done_windows=done_windows))
+
+    assert [int(e['timestamp']) for e in kept] == all_timestamps()
+    assert len(done_windows) == DAYS
+
+
+def test_iter_history_close_does_not_wait_for_pending_windows():
+    block = threading.Event()
+    client = StubClient(block=block)
+
+    history = client.iter_history('01/01/2024', '01/08/2024', max_workers=2)
+    next(history)
+
+    started = time.time()
+    history.close()
+    elapsed = time.time() - started
+    block.set()
+
+    assert elapsed < 1
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+import requests
+
+import jotform
+from jotform import JotformAPIClient
+
+
+class StubClient(JotformAPIClient):
+
+    def __init__(self, responses=None):
+        super(StubClient, self).__init__('KEY')
+        self.responses = responses or {}
+        self.calls = []
+
+    def fetch_url(self, url, params=None, method=None):
+        self.calls.append((method, url, params))
+        return self.responses.get(url)
+
+
+def test_diff_properties_compares_scalars_as_strings():
+    current = {'labelWidth': '150', 'title': 'Form', 'emails': []}
+    desired = {'labelWidth': 150, 'title': 'New form', 'emails': [], 'height': '500'}
+
+    assert JotformAPIClient.diff_properties(current, desired) == {
+        'title': 'New form',
+        'height': '500'
+    }
+
+
+def test_diff_properties_compares_lists_and_dicts_as_is():
+    current = {'emails': [{'to': 'a@example.com'}], 'styles': {'a': '1'}}
+    desired = {'emails': [{'to': 'b@example.com'}], 'styles': {'a': '1'}}
+
+    assert JotformAPIClient.diff_properties(current, desired) == {
+        'emails': [{'to': 'b@example.com'}]
+    }
+
+
+def test_diff_properties_skips_none():
+    assert JotformAPIClient.diff_properties({'title': 'Form'}, {'title': None, 'x': None}) == {}
+
+
+def test_diff_properties_without_current():
+    assert JotformAPIClient.diff_properties(None, {'title': 'Form'}) == {'title': 'Form'}
+
+
+def test_reconcile_form_properties_fetches_once_and_posts_changes():
+    client = StubClient({'/form/1/properties': {'title': 'Form', 'labelWidth': '150'}})
+
+    changed = client.reconcile_form_properties('1', {'title': 'Form', 'labelWidth': '200'})
+
+    assert changed == {'labelWidth': '200'}
+    assert client.calls == [
+        ('GET', '/form/1/properties', None),
+        ('POST', '/form/1/properties', {'properties[labelWidth]': '200'})
+    ]
+
+
+def test_reconcile_form_properties_with_cache_and_no_changes():
+    client = StubClient()
+
+    changed = client.reconcile_form_properties('1', {'title': 'Form'}, {'title': 'Form'})
+
+    assert changed == {}
+    assert client.calls == []
+
+
+def test_reconcile_form_questions_edits_only_changed_questions():
+    current = {
+        '1': {'type': 'control_head', 'text': 'Title'},
+        '2': {'type': 'control_textbox', 'text': 'Name', 'required': 'No'},
+        '3': {'type': 'control_email', 'text': 'Email'}
+    }
+    client = StubClient({'/form/1/questions': current})
+
+    changes = client.reconcile_form_questions('1', {
+        '1': {'text': 'Title'},
+        '2': {'text': 'Name', 'required': 'Yes'},
+        '4': {'type': 'control_number', 'text': 'Age'}
+    })
+
+    assert changes == {
+        '2': {'required': 'Yes'},
+        '4': {'type': 'control_number', 'text': 'Age'}
+    }
+    assert client.calls == [
+        ('GET', '/form/1/questions', None),
+        ('POST', '/form/1/question/2', {'question[required]': 'Yes'}),
+        ('POST', '/form/1/question/4', {
+            'question[type]': 'control_number',
+            'question[text]': 'Age'
+        })
+    ]
+
+
+def test_reconcile_form_properties_puts_nested_values_as_json():
+    client = StubClient()
+    current = {'title': 'Form', 'emails': [{'to': 'a@example.com'}]}
+
+    changed = client.reconcile_form_properties('1', {
+        'title': 'New form',
+        'emails': [{'to': 'b@example.com'}]
+    }, current)
+
+    assert changed == {'title': 'New form', 'emails': [{'to': 'b@example.com'}]}
+    assert client.calls == [
+        ('POST', '/form/1/properties', {'properties[title]': 'New form'}),
+        ('PUT', '/form/1/properties',
+         json.dumps({'properties': {'emails': [{'to': 'b@example.com'}]}}))
+    ]
+
+
+def test_nested_properties_are_sent_in_the_request_body(monkeypatch):
+    sent = []
+
+    class Response(object):
+        def json(self):
+            return {'content': {}}
+
+    def request(**kwargs):
+        sent.append(requests.Request(**kwargs).prepare())
+        return Response()
+
+    monkeypatch.setattr(jotform.requests, 'request', request)
+    client = JotformAPIClient('KEY')
+
+    client.reconcile_form_properties('1', {'emails': [{'to': 'b@example.com'}],
+                                           'styles': {'color': 'red'}}, {})
+
+    assert len(sent) == 1
+    assert sent[0].method == 'PUT'
+    assert sent[0].url.endswith('/form/1/properties.json')
+    assert json.loads(sent[0].body) == {'properties': {
+        'emails': [{'to': 'b@example.com'}],
+        'styles': {'color': 'red'}
+    }}
+
+
+def test_reconcile_form_questions_rejects_nested_values():
+    client = StubClient()
+    current = {'1': {'text': 'Name'}, '2': {'text': 'Pets'}}
+
+    with pytest.raises(ValueError, match='Question 2 property options'):
+        client.reconcile_form_questions('1', {
+            '1': {'text': 'Full name'},
+            '2': {'options': ['Cat', 'Dog']}
+        }, current)
+
+    assert client.calls == []